@@ -0,0 +1,201 @@
+"""
+Per-request identity map and optional cross-request cache for model instances.
+
+Every (model, pk) is loaded at most once per request. Organization and Project
+rows change rarely, so they can additionally be served from a Django cache
+backend when ``OBJECT_CACHE['ENABLED']`` is set. Cache entries are stamped with
+a per-row version that writes bump once their transaction commits. A read that
+races with a write caches the old row under the old stamp, which the bump then
+makes unreachable.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .models import Organization, Project
+
+CACHED_MODELS = (Organization, Project)
+
+DEFAULTS = {
+    'ENABLED': False,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+    'PREFIX': 'objcache',
+}
+
+
+def get_object_cache_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'OBJECT_CACHE', {}))
+    return config
+
+
+class ObjectCache:
+    """
+    Version-stamped cache of model instances keyed by model label and pk.
+    """
+
+    def __init__(self, alias, timeout, prefix):
+        self.cache = caches[alias]
+        self.timeout = timeout
+        self.prefix = prefix
+
+    def _version_key(self, model, pk):
+        return f'{self.prefix}:{model._meta.label_lower}:{pk}:version'
+
+    def _version(self, model, pk):
+        key = self._version_key(model, pk)
+        version = self.cache.get(key)
+        if version is None:
+            # Start from a fresh stamp so entries written under an evicted version stay unreachable
+            self.cache.add(key, time.time_ns(), None)
+            version = self.cache.get(key)
+        return version
+
+    def _instance_key(self, model, pk, version):
+        return f'{self.prefix}:{model._meta.label_lower}:{pk}:{version}'
+
+    def get(self, model, pk):
+        """
+        Return ``(instance, version)``; instance is None on a miss.
+        """
+        version = self._version(model, pk)
+        return self.cache.get(self._instance_key(model, pk, version)), version
+
+    def set(self, instance, version):
+        model = type(instance)
+        self.cache.set(self._instance_key(model, instance.pk, version), instance, self.timeout)
+
+    def get_pk_by_slug(self, model, slug):
+        return self.cache.get(f'{self.prefix}:{model._meta.label_lower}:slug:{slug}')
+
+    def set_pk_by_slug(self, model, slug, pk):
+        self.cache.set(f'{self.prefix}:{model._meta.label_lower}:slug:{slug}', pk, self.timeout)
+
+    def invalidate(self, model, pk):
+        key = self._version_key(model, pk)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.add(key, time.time_ns(), None)
+
+
+def get_object_cache():
+    config = get_object_cache_settings()
+    if not config['ENABLED']:
+        return None
+    return ObjectCache(config['CACHE_ALIAS'], config['TIMEOUT'], config['PREFIX'])
+
+
+def invalidate_cached_instance(model, pk):
+    """
+    Bump the cached row's version after the current transaction commits.
+    Bumping earlier would let a concurrent reader cache the old committed
+    row under the new stamp.
+    """
+    object_cache = get_object_cache()
+    if object_cache is not None and model in CACHED_MODELS:
+        transaction.on_commit(lambda: object_cache.invalidate(model, pk))
+
+
+class IdentityMap:
+    """
+    Model instances loaded during a single request, keyed by (model, pk).
+    """
+
+    def __init__(self):
+        self._instances = {}
+
+    def _key(self, model, pk):
+        return model._meta.label_lower, model._meta.pk.to_python(pk)
+
+    def add(self, instance):
+        self._instances[self._key(type(instance), instance.pk)] = instance
+        return instance
+
+    def setdefault(self, instance):
+        """
+        Register ``instance`` unless the map already holds that row; return the mapped instance.
+        """
+        return self._instances.setdefault(self._key(type(instance), instance.pk), instance)
+
+    def get(self, model, pk):
+        """
+        Return the instance, loading it once from the object cache or database.
+        Raises ``model.DoesNotExist`` like ``Model.objects.get``.
+        """
+        key = self._key(model, pk)
+        if key in self._instances:
+            return self._instances[key]
+
+        object_cache = get_object_cache() if model in CACHED_MODELS else None
+        if object_cache is not None:
+            instance, version = object_cache.get(model, key[1])
+            if instance is None:
+                instance = model.objects.get(pk=key[1])
+                object_cache.set(instance, version)
+        else:
+            instance = model.objects.get(pk=key[1])
+
+        self._instances[key] = instance
+        return instance
+
+
+def get_identity_map(request):
+    """
+    Return the identity map attached to ``request``, creating it on first use.
+    """
+    if request is None:
+        return IdentityMap()
+    identity_map = getattr(request, '_identity_map', None)
+    if identity_map is None:
+        identity_map = IdentityMap()
+        request._identity_map = identity_map
+    return identity_map
+
+
+def load_instance(request, model, pk):
+    return get_identity_map(request).get(model, pk)
+
+
+def load_related(request, instance, field_name):
+    """
+    Resolve a foreign key through the identity map and cache it on ``instance``
+    so later attribute access (including ``__str__``) does not query again.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        # Rows fetched with select_related join the map so later lookups reuse them
+        related = get_identity_map(request).setdefault(field.get_cached_value(instance))
+    else:
+        related = load_instance(request, field.related_model, getattr(instance, field.attname))
+    field.set_cached_value(instance, related)
+    return related
+
+
+def load_organization_by_slug(slug):
+    """
+    Look up an organization by slug, going through the object cache when enabled.
+    """
+    object_cache = get_object_cache()
+    if object_cache is None:
+        return Organization.objects.get(slug=slug)
+
+    pk = object_cache.get_pk_by_slug(Organization, slug)
+    if pk is not None:
+        instance, version = object_cache.get(Organization, pk)
+        if instance is None:
+            instance = Organization.objects.filter(pk=pk).first()
+            if instance is not None:
+                object_cache.set(instance, version)
+        # The slug may have been renamed since the mapping was cached
+        if instance is not None and instance.slug == slug:
+            return instance
+
+    # Only the slug mapping is cached here; the row itself is cached on the next
+    # lookup by pk, where its version is read before the database is queried
+    instance = Organization.objects.get(slug=slug)
+    object_cache.set_pk_by_slug(Organization, slug, instance.pk)
+    return instance
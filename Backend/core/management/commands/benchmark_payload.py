@@ -0,0 +1,88 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+
+from core.views import available_encodings, compress, encode_json, orjson
+
+
+def build_project_payload(task_count):
+    """
+    Build a GET_PROJECT-shaped response with ``task_count`` tasks.
+    """
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statuses = ['TODO', 'IN_PROGRESS', 'DONE']
+    tasks = [
+        {
+            'id': str(i + 1),
+            'title': f'Task {i + 1}: implement feature area {i % 97}',
+            'status': statuses[i % 3],
+            'assigneeEmail': f'user{i % 250}@example.com',
+            'dueDate': (created + timedelta(days=i % 365)).isoformat(),
+            'createdAt': (created + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(task_count)
+    ]
+    return {
+        'data': {
+            'project': {
+                'id': '1',
+                'name': 'Benchmark Project',
+                'status': 'ACTIVE',
+                'description': 'Synthetic project used for payload benchmarks',
+                'dueDate': '2024-12-31',
+                'taskCount': task_count,
+                'completedTaskCount': task_count // 3,
+                'completionRate': 33.33,
+                'createdAt': created.isoformat(),
+                'tasks': tasks,
+            }
+        }
+    }
+
+
+def _time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+class Command(BaseCommand):
+    help = 'Benchmark GraphQL response serialization time and bytes on the wire'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        payload = build_project_payload(options['tasks'])
+        repeat = options['repeat']
+
+        self.stdout.write(f"GET_PROJECT payload with {options['tasks']} tasks (best of {repeat})")
+
+        elapsed, body = _time(lambda: json.dumps(payload).encode('utf-8'), repeat)
+        self._row('json (default)', elapsed, len(body))
+
+        elapsed, body = _time(
+            lambda: json.dumps(payload, separators=(',', ':')).encode('utf-8'), repeat
+        )
+        self._row('json (compact)', elapsed, len(body))
+
+        if orjson is not None:
+            elapsed, body = _time(lambda: orjson.dumps(payload), repeat)
+            self._row('orjson', elapsed, len(body))
+        else:
+            self.stdout.write('orjson not installed, skipped')
+
+        body = encode_json(payload)
+        for coding in available_encodings():
+            elapsed, compressed = _time(lambda: compress(body, coding), repeat)
+            self._row(f'compact + {coding}', elapsed, len(compressed))
+
+    def _row(self, label, elapsed, size):
+        self.stdout.write(f'{label:<20} {elapsed * 1000:>9.2f} ms {size:>12,} bytes')
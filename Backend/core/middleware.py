@@ -1,5 +1,15 @@
+import math
+
 from django.http import JsonResponse
+from .loaders import get_identity_map, load_organization_by_slug
 from .models import Organization
+from .throttling import (
+    ANONYMOUS_TENANT,
+    get_operation_type,
+    get_throttle_settings,
+    get_throttle_store,
+    throttle_metrics,
+)
 
 
 class OrganizationMiddleware:
@@ -24,8 +34,8 @@ class OrganizationMiddleware:
 
         if org_slug and request.path.startswith('/graphql/'):
             try:
-                organization = Organization.objects.get(slug=org_slug)
-                request.organization = organization
+                organization = load_organization_by_slug(org_slug)
+                request.organization = get_identity_map(request).setdefault(organization)
             except Organization.DoesNotExist:
                 return JsonResponse({
                     'error': 'Organization not found',
@@ -35,4 +45,59 @@ class OrganizationMiddleware:
             request.organization = None
 
         response = self.get_response(request)
+        return response
+
+
+class GraphQLThrottleMiddleware:
+    """
+    Middleware to rate limit GraphQL requests per organization.
+    Must run after OrganizationMiddleware so the tenant is already resolved.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = get_throttle_settings()
+        if not config['ENABLED'] or not request.path.startswith('/graphql/'):
+            return self.get_response(request)
+
+        # CORS preflight and other non-API methods pass through untouched
+        if request.method not in ('GET', 'POST'):
+            return self.get_response(request)
+
+        organization = getattr(request, 'organization', None)
+        tenant = organization.slug if organization else ANONYMOUS_TENANT
+        operation = get_operation_type(request)
+        store = get_throttle_store(config)
+
+        cost = config['MUTATION_COST'] if operation == 'mutation' else config['QUERY_COST']
+        cost = min(cost, config['BURST'])
+        wait = store.consume(f'{tenant}:{operation}', cost, config['RATE'], config['BURST'])
+        if wait > 0:
+            throttle_metrics.record(tenant, operation, 'rate')
+            return self._throttled('Rate limit exceeded', 'RATE_LIMITED', wait)
+
+        limit = config['MAX_CONCURRENT']
+        if not limit:
+            return self.get_response(request)
+
+        if not store.acquire(tenant, limit):
+            throttle_metrics.record(tenant, operation, 'concurrency')
+            return self._throttled('Too many concurrent requests', 'CONCURRENCY_LIMITED', 1)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            store.release(tenant)
+        return response
+
+    def _throttled(self, message, code, wait):
+        retry_after = max(1, math.ceil(wait))
+        response = JsonResponse({
+            'error': message,
+            'code': code,
+            'retry_after': retry_after
+        }, status=429)
+        response['Retry-After'] = str(retry_after)
         return response
\ No newline at end of file
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_version_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee_email', 'status', '-id'], name='task_assignee_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee_email', 'status', 'due_date'], include=('project',), name='task_assignee_workload_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 07:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_version_not_editable'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee_email', '-id'], name='task_assignee_id_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.utils.text import slugify
 
 
@@ -20,7 +21,36 @@ class Organization(models.Model):
         ordering = ['name']
 
 
-class Project(models.Model):
+class VersionedModel(models.Model):
+    """
+    Adds a row version for optimistic locking. Every update made through save()
+    bumps it in the database, so edits outside the GraphQL mutations, including
+    saves from stale copies, still invalidate versions clients hold.
+    """
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version'}
+
+        previous_version = self.version
+        self.version = F('version') + 1
+        try:
+            super().save(*args, **kwargs)
+        except Exception:
+            self.version = previous_version
+            raise
+        self.refresh_from_db(fields=['version'])
+
+
+class Project(VersionedModel):
     STATUS_CHOICES = [
         ('ACTIVE', 'Active'),
         ('COMPLETED', 'Completed'),
@@ -47,7 +77,7 @@ class Project(models.Model):
         unique_together = ['organization', 'name']
 
 
-class Task(models.Model):
+class Task(VersionedModel):
     STATUS_CHOICES = [
         ('TODO', 'To Do'),
         ('IN_PROGRESS', 'In Progress'),
@@ -72,6 +102,18 @@ class Task(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination for "my tasks" lists, with and without a status filter
+            models.Index(fields=['assignee_email', '-id'], name='task_assignee_id_idx'),
+            models.Index(fields=['assignee_email', 'status', '-id'], name='task_assignee_status_id_idx'),
+            # Covers workload counts, which count status rather than id so every
+            # column read is in the index; project_id serves the tenant join
+            models.Index(
+                fields=['assignee_email', 'status', 'due_date'],
+                include=['project'],
+                name='task_assignee_workload_idx'
+            ),
+        ]
 
 
 class TaskComment(models.Model):
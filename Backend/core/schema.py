@@ -1,17 +1,43 @@
 import graphene
 from graphene_django import DjangoObjectType
 from graphene_django.filter import DjangoFilterConnectionField
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from .loaders import (
+    get_identity_map,
+    invalidate_cached_instance,
+    load_instance,
+    load_organization_by_slug,
+    load_related,
+)
 from .models import Organization, Project, Task, TaskComment
 
 
-class OrganizationType(DjangoObjectType):
+class IdentityMapObjectType(DjangoObjectType):
+    """
+    Loads related objects through the per-request identity map instead of
+    graphene-django's default one query per foreign key access.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_node(cls, info, id):
+        model = cls._meta.model
+        try:
+            return load_instance(info.context, model, id)
+        except model.DoesNotExist:
+            return None
+
+
+class OrganizationType(IdentityMapObjectType):
     class Meta:
         model = Organization
         fields = '__all__'
 
 
-class ProjectType(DjangoObjectType):
+class ProjectType(IdentityMapObjectType):
     task_count = graphene.Int()
     completed_task_count = graphene.Int()
     completion_rate = graphene.Float()
@@ -20,6 +46,9 @@ class ProjectType(DjangoObjectType):
         model = Project
         fields = '__all__'
 
+    def resolve_organization(self, info):
+        return load_related(info.context, self, 'organization')
+
     def resolve_task_count(self, info):
         return self.tasks.count()
 
@@ -34,22 +63,28 @@ class ProjectType(DjangoObjectType):
         return (completed / total) * 100
 
 
-class TaskType(DjangoObjectType):
+class TaskType(IdentityMapObjectType):
     comment_count = graphene.Int()
 
     class Meta:
         model = Task
         fields = '__all__'
 
+    def resolve_project(self, info):
+        return load_related(info.context, self, 'project')
+
     def resolve_comment_count(self, info):
         return self.comments.count()
 
 
-class TaskCommentType(DjangoObjectType):
+class TaskCommentType(IdentityMapObjectType):
     class Meta:
         model = TaskComment
         fields = '__all__'
 
+    def resolve_task(self, info):
+        return load_related(info.context, self, 'task')
+
 
 class ProjectStatsType(graphene.ObjectType):
     total_projects = graphene.Int()
@@ -60,6 +95,23 @@ class ProjectStatsType(graphene.ObjectType):
     overall_completion_rate = graphene.Float()
 
 
+class TaskPageType(graphene.ObjectType):
+    tasks = graphene.List(TaskType)
+    end_cursor = graphene.String()
+    has_next_page = graphene.Boolean()
+
+
+class AssigneeWorkloadType(graphene.ObjectType):
+    assignee_email = graphene.String()
+    open_count = graphene.Int(description="Tasks not yet done")
+    in_progress_count = graphene.Int()
+    overdue_count = graphene.Int(description="Open tasks past their due date")
+
+
+MY_TASKS_DEFAULT_PAGE_SIZE = 50
+MY_TASKS_MAX_PAGE_SIZE = 200
+
+
 class Query(graphene.ObjectType):
     # Organization queries
     organizations = graphene.List(OrganizationType)
@@ -72,6 +124,15 @@ class Query(graphene.ObjectType):
     # Task queries
     tasks = graphene.List(TaskType, project_id=graphene.ID())
     task = graphene.Field(TaskType, id=graphene.ID(required=True))
+    my_tasks = graphene.Field(
+        TaskPageType,
+        assignee_email=graphene.String(required=True),
+        status=graphene.String(),
+        due_before=graphene.DateTime(),
+        first=graphene.Int(),
+        after=graphene.String()
+    )
+    assignee_workloads = graphene.List(AssigneeWorkloadType, assignee_email=graphene.String())
 
     # Comment queries
     task_comments = graphene.List(TaskCommentType, task_id=graphene.ID(required=True))
@@ -84,7 +145,7 @@ class Query(graphene.ObjectType):
 
     def resolve_organization(self, info, slug):
         try:
-            return Organization.objects.get(slug=slug)
+            return get_identity_map(info.context).setdefault(load_organization_by_slug(slug))
         except Organization.DoesNotExist:
             return None
 
@@ -101,10 +162,10 @@ class Query(graphene.ObjectType):
 
     def resolve_project(self, info, id):
         try:
-            project = Project.objects.get(id=id)
+            project = load_instance(info.context, Project, id)
             # Check organization access
             if hasattr(info.context, 'organization') and info.context.organization:
-                if project.organization != info.context.organization:
+                if load_related(info.context, project, 'organization') != info.context.organization:
                     return None
             return project
         except Project.DoesNotExist:
@@ -124,15 +185,74 @@ class Query(graphene.ObjectType):
 
     def resolve_task(self, info, id):
         try:
-            task = Task.objects.get(id=id)
+            task = load_instance(info.context, Task, id)
             # Check organization access
             if hasattr(info.context, 'organization') and info.context.organization:
-                if task.project.organization != info.context.organization:
+                project = load_related(info.context, task, 'project')
+                if load_related(info.context, project, 'organization') != info.context.organization:
                     return None
             return task
         except Task.DoesNotExist:
             return None
 
+    def resolve_my_tasks(self, info, assignee_email, status=None, due_before=None, first=None, after=None):
+        queryset = Task.objects.filter(assignee_email=assignee_email).select_related('project')
+
+        if status:
+            queryset = queryset.filter(status=status)
+        if due_before:
+            queryset = queryset.filter(due_date__lt=due_before)
+
+        # Filter by organization through project relationship
+        if hasattr(info.context, 'organization') and info.context.organization:
+            queryset = queryset.filter(project__organization=info.context.organization)
+
+        # Keyset pagination on id, newest first; the cursor is the last id returned
+        if after:
+            try:
+                queryset = queryset.filter(id__lt=int(after))
+            except ValueError:
+                raise Exception("Invalid cursor")
+
+        page_size = MY_TASKS_DEFAULT_PAGE_SIZE if first is None else first
+        if page_size < 1:
+            raise Exception("first must be positive")
+        page_size = min(page_size, MY_TASKS_MAX_PAGE_SIZE)
+
+        tasks = list(queryset.order_by('-id')[:page_size + 1])
+        has_next_page = len(tasks) > page_size
+        tasks = tasks[:page_size]
+
+        return TaskPageType(
+            tasks=tasks,
+            end_cursor=str(tasks[-1].id) if tasks else None,
+            has_next_page=has_next_page
+        )
+
+    def resolve_assignee_workloads(self, info, assignee_email=None):
+        queryset = Task.objects.exclude(assignee_email='')
+
+        if assignee_email:
+            queryset = queryset.filter(assignee_email=assignee_email)
+
+        # Filter by organization through project relationship
+        if hasattr(info.context, 'organization') and info.context.organization:
+            queryset = queryset.filter(project__organization=info.context.organization)
+
+        not_done = ~Q(status='DONE')
+        rows = (
+            queryset
+            .order_by('assignee_email')
+            .values('assignee_email')
+            .annotate(
+                # Count an indexed column so the workload index can answer without the table
+                open_count=Count('status', filter=not_done),
+                in_progress_count=Count('status', filter=Q(status='IN_PROGRESS')),
+                overdue_count=Count('status', filter=not_done & Q(due_date__lt=timezone.now()))
+            )
+        )
+        return [AssigneeWorkloadType(**row) for row in rows]
+
     def resolve_task_comments(self, info, task_id):
         queryset = TaskComment.objects.filter(task_id=task_id)
         
@@ -173,6 +293,33 @@ class Query(graphene.ObjectType):
         )
 
 
+class ProjectVersionConflictType(graphene.ObjectType):
+    message = graphene.String()
+    current = graphene.Field(ProjectType)
+
+
+class TaskVersionConflictType(graphene.ObjectType):
+    message = graphene.String()
+    current = graphene.Field(TaskType)
+
+
+def apply_versioned_update(queryset, changes, version=None):
+    """
+    Write only the changed columns in a single UPDATE, bumping the row version.
+    When ``version`` is given the row is only updated if it still has that version.
+    Returns True if a row matched.
+    """
+    if version is not None:
+        queryset = queryset.filter(version=version)
+    if not changes:
+        return queryset.exists()
+    return queryset.update(
+        version=F('version') + 1,
+        updated_at=timezone.now(),
+        **changes
+    ) > 0
+
+
 # Mutations
 class CreateOrganization(graphene.Mutation):
     class Arguments:
@@ -205,7 +352,7 @@ class CreateProject(graphene.Mutation):
             organization = info.context.organization
         elif organization_slug:
             try:
-                organization = Organization.objects.get(slug=organization_slug)
+                organization = load_organization_by_slug(organization_slug)
             except Organization.DoesNotExist:
                 raise Exception("Organization not found")
         else:
@@ -227,32 +374,48 @@ class UpdateProject(graphene.Mutation):
         description = graphene.String()
         status = graphene.String()
         due_date = graphene.Date()
+        version = graphene.Int()
 
     project = graphene.Field(ProjectType)
+    conflict = graphene.Field(ProjectVersionConflictType)
+
+    def mutate(self, info, id, name=None, description=None, status=None, due_date=None, version=None):
+        changes = {}
+        if name is not None:
+            changes['name'] = name
+        if description is not None:
+            changes['description'] = description
+        if status is not None:
+            changes['status'] = status
+        if due_date is not None:
+            changes['due_date'] = due_date
+
+        # Organization access is enforced in the UPDATE itself
+        queryset = Project.objects.filter(id=id)
+        if hasattr(info.context, 'organization') and info.context.organization:
+            queryset = queryset.filter(organization=info.context.organization)
 
-    def mutate(self, info, id, name=None, description=None, status=None, due_date=None):
-        try:
-            project = Project.objects.get(id=id)
-            
-            # Check organization access
-            if hasattr(info.context, 'organization') and info.context.organization:
-                if project.organization != info.context.organization:
-                    raise Exception("Access denied")
-            
-            if name is not None:
-                project.name = name
-            if description is not None:
-                project.description = description
-            if status is not None:
-                project.status = status
-            if due_date is not None:
-                project.due_date = due_date
-            
-            project.save()
+        if apply_versioned_update(queryset, changes, version):
+            # The row changed, so replace any copy this request already loaded
+            project = get_identity_map(info.context).add(Project.objects.get(id=id))
+            # Queryset updates bypass post_save, so drop the cached copy explicitly
+            invalidate_cached_instance(Project, project.pk)
             return UpdateProject(project=project)
+
+        try:
+            current = Project.objects.get(id=id)
         except Project.DoesNotExist:
             raise Exception("Project not found")
 
+        if hasattr(info.context, 'organization') and info.context.organization:
+            if current.organization_id != info.context.organization.id:
+                raise Exception("Access denied")
+
+        return UpdateProject(conflict=ProjectVersionConflictType(
+            message=f"Project was modified (expected version {version}, current version {current.version})",
+            current=current
+        ))
+
 
 class CreateTask(graphene.Mutation):
     class Arguments:
@@ -265,11 +428,11 @@ class CreateTask(graphene.Mutation):
 
     def mutate(self, info, project_id, title, description=None, assignee_email=None):
         try:
-            project = Project.objects.get(id=project_id)
+            project = load_instance(info.context, Project, project_id)
             
             # Check organization access
             if hasattr(info.context, 'organization') and info.context.organization:
-                if project.organization != info.context.organization:
+                if load_related(info.context, project, 'organization') != info.context.organization:
                     raise Exception("Access denied")
             
             task = Task.objects.create(
@@ -290,32 +453,45 @@ class UpdateTask(graphene.Mutation):
         description = graphene.String()
         status = graphene.String()
         assignee_email = graphene.String()
+        version = graphene.Int()
 
     task = graphene.Field(TaskType)
+    conflict = graphene.Field(TaskVersionConflictType)
+
+    def mutate(self, info, id, title=None, description=None, status=None, assignee_email=None, version=None):
+        changes = {}
+        if title is not None:
+            changes['title'] = title
+        if description is not None:
+            changes['description'] = description
+        if status is not None:
+            changes['status'] = status
+        if assignee_email is not None:
+            changes['assignee_email'] = assignee_email
+
+        # Organization access is enforced in the UPDATE itself
+        queryset = Task.objects.filter(id=id)
+        if hasattr(info.context, 'organization') and info.context.organization:
+            queryset = queryset.filter(project__organization=info.context.organization)
 
-    def mutate(self, info, id, title=None, description=None, status=None, assignee_email=None):
-        try:
-            task = Task.objects.get(id=id)
-            
-            # Check organization access
-            if hasattr(info.context, 'organization') and info.context.organization:
-                if task.project.organization != info.context.organization:
-                    raise Exception("Access denied")
-            
-            if title is not None:
-                task.title = title
-            if description is not None:
-                task.description = description
-            if status is not None:
-                task.status = status
-            if assignee_email is not None:
-                task.assignee_email = assignee_email
-            
-            task.save()
+        if apply_versioned_update(queryset, changes, version):
+            task = get_identity_map(info.context).add(Task.objects.get(id=id))
             return UpdateTask(task=task)
+
+        try:
+            current = Task.objects.select_related('project').get(id=id)
         except Task.DoesNotExist:
             raise Exception("Task not found")
 
+        if hasattr(info.context, 'organization') and info.context.organization:
+            if current.project.organization_id != info.context.organization.id:
+                raise Exception("Access denied")
+
+        return UpdateTask(conflict=TaskVersionConflictType(
+            message=f"Task was modified (expected version {version}, current version {current.version})",
+            current=current
+        ))
+
 
 class AddTaskComment(graphene.Mutation):
     class Arguments:
@@ -327,11 +503,12 @@ class AddTaskComment(graphene.Mutation):
 
     def mutate(self, info, task_id, content, author_email):
         try:
-            task = Task.objects.get(id=task_id)
+            task = load_instance(info.context, Task, task_id)
             
             # Check organization access
             if hasattr(info.context, 'organization') and info.context.organization:
-                if task.project.organization != info.context.organization:
+                project = load_related(info.context, task, 'project')
+                if load_related(info.context, project, 'organization') != info.context.organization:
                     raise Exception("Access denied")
             
             comment = TaskComment.objects.create(
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .loaders import invalidate_cached_instance
+from .models import Organization, Project
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_object_cache(sender, instance, **kwargs):
+    invalidate_cached_instance(sender, instance.pk)
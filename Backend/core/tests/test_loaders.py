@@ -0,0 +1,59 @@
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from core.loaders import IdentityMap, get_object_cache
+from core.models import Organization, Project
+from core.schema import schema
+from core.tests.test_schema import UPDATE_PROJECT
+
+OBJECT_CACHE_SETTINGS = {
+    'CACHES': {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'loader-tests'},
+    },
+    'OBJECT_CACHE': {'ENABLED': True},
+}
+
+
+@override_settings(**OBJECT_CACHE_SETTINGS)
+class ObjectCacheTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.organization = Organization.objects.create(name='Acme', contact_email='ops@acme.test')
+        self.project = Project.objects.create(organization=self.organization, name='Launch')
+
+    def load(self):
+        return IdentityMap().get(Project, self.project.pk)
+
+    def test_version_bump_waits_for_commit(self):
+        object_cache = get_object_cache()
+        self.load()
+        _, before = object_cache.get(Project, self.project.pk)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.project.name = 'Renamed'
+            self.project.save()
+        _, during = object_cache.get(Project, self.project.pk)
+        self.assertEqual(during, before)
+
+        for callback in callbacks:
+            callback()
+        _, after = object_cache.get(Project, self.project.pk)
+        self.assertNotEqual(after, before)
+        self.assertEqual(self.load().name, 'Renamed')
+
+    def test_delete_invalidates(self):
+        self.load()
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.filter(pk=self.project.pk).delete()
+        with self.assertRaises(Project.DoesNotExist):
+            self.load()
+
+    def test_update_project_invalidates_normalized_pk(self):
+        self.load()
+        with self.captureOnCommitCallbacks(execute=True):
+            result = schema.execute(
+                UPDATE_PROJECT,
+                variable_values={'id': f'0{self.project.pk}', 'name': 'Relaunch'},
+            )
+        self.assertIsNone(result.errors)
+        self.assertEqual(self.load().name, 'Relaunch')
@@ -0,0 +1,177 @@
+from datetime import timedelta
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from core.loaders import get_identity_map
+from core.models import Organization, Project, Task
+from core.schema import schema
+
+UPDATE_PROJECT = '''
+    mutation($id: ID!, $name: String, $version: Int) {
+        updateProject(id: $id, name: $name, version: $version) {
+            project { id name version }
+            conflict { message current { name version } }
+        }
+    }
+'''
+
+UPDATE_TASK = '''
+    mutation($id: ID!, $status: String, $version: Int) {
+        updateTask(id: $id, status: $status, version: $version) {
+            task { id status version }
+            conflict { message current { status version } }
+        }
+    }
+'''
+
+
+class GraphQLTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Organization.objects.create(name='Acme', contact_email='ops@acme.test')
+        cls.other = Organization.objects.create(name='Other', contact_email='ops@other.test')
+        cls.project = Project.objects.create(organization=cls.acme, name='Launch')
+        cls.task = Task.objects.create(project=cls.project, title='Write docs')
+
+    def execute(self, query, organization=None, **variables):
+        request = RequestFactory().post('/graphql/')
+        request.organization = organization
+        return schema.execute(query, variable_values=variables, context_value=request)
+
+
+class UpdateProjectTests(GraphQLTestCase):
+    def test_update_with_current_version(self):
+        result = self.execute(UPDATE_PROJECT, self.acme, id=self.project.id, name='Relaunch', version=1)
+        self.assertIsNone(result.errors)
+        payload = result.data['updateProject']
+        self.assertEqual(payload['project'], {'id': str(self.project.id), 'name': 'Relaunch', 'version': 2})
+        self.assertIsNone(payload['conflict'])
+
+    def test_stale_version_returns_current_state(self):
+        Project.objects.filter(id=self.project.id).update(name='Changed elsewhere', version=3)
+        result = self.execute(UPDATE_PROJECT, self.acme, id=self.project.id, name='Relaunch', version=1)
+        self.assertIsNone(result.errors)
+        payload = result.data['updateProject']
+        self.assertIsNone(payload['project'])
+        self.assertEqual(payload['conflict']['current'], {'name': 'Changed elsewhere', 'version': 3})
+        self.assertEqual(Project.objects.get(id=self.project.id).name, 'Changed elsewhere')
+
+    def test_other_organization_is_denied(self):
+        result = self.execute(UPDATE_PROJECT, self.other, id=self.project.id, name='Hijacked')
+        self.assertEqual(result.errors[0].message, 'Access denied')
+        self.assertEqual(Project.objects.get(id=self.project.id).name, 'Launch')
+
+    def test_missing_project(self):
+        result = self.execute(UPDATE_PROJECT, self.acme, id=999999, name='Ghost')
+        self.assertEqual(result.errors[0].message, 'Project not found')
+
+
+class UpdateTaskTests(GraphQLTestCase):
+    def test_update_writes_only_changed_fields(self):
+        result = self.execute(UPDATE_TASK, self.acme, id=self.task.id, status='DONE', version=1)
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data['updateTask']['task']['version'], 2)
+        task = Task.objects.get(id=self.task.id)
+        self.assertEqual((task.status, task.title), ('DONE', 'Write docs'))
+
+    def test_stale_version_returns_current_state(self):
+        self.execute(UPDATE_TASK, self.acme, id=self.task.id, status='IN_PROGRESS', version=1)
+        result = self.execute(UPDATE_TASK, self.acme, id=self.task.id, status='DONE', version=1)
+        self.assertIsNone(result.errors)
+        payload = result.data['updateTask']
+        self.assertIsNone(payload['task'])
+        self.assertEqual(payload['conflict']['current'], {'status': 'IN_PROGRESS', 'version': 2})
+
+    def test_other_organization_is_denied(self):
+        result = self.execute(UPDATE_TASK, self.other, id=self.task.id, status='DONE')
+        self.assertEqual(result.errors[0].message, 'Access denied')
+        self.assertEqual(Task.objects.get(id=self.task.id).status, 'TODO')
+
+    def test_missing_task(self):
+        result = self.execute(UPDATE_TASK, self.acme, id=999999, status='DONE')
+        self.assertEqual(result.errors[0].message, 'Task not found')
+
+
+class VersionSaveTests(GraphQLTestCase):
+    def test_save_bumps_version(self):
+        self.project.save()
+        self.assertEqual(Project.objects.get(id=self.project.id).version, 2)
+
+    def test_save_with_update_fields_bumps_version(self):
+        self.task.title = 'Edited'
+        self.task.save(update_fields=['title'])
+        self.assertEqual(self.task.version, 2)
+        self.assertEqual(Task.objects.get(id=self.task.id).version, 2)
+
+    def test_stale_copy_save_does_not_reuse_a_version(self):
+        stale = Task.objects.get(id=self.task.id)
+        Task.objects.filter(id=self.task.id).update(title='From API', version=2)
+        stale.title = 'From admin'
+        stale.save()
+        self.assertEqual(stale.version, 3)
+        result = self.execute(UPDATE_TASK, self.acme, id=self.task.id, status='DONE', version=2)
+        self.assertIsNone(result.data['updateTask']['task'])
+        self.assertEqual(result.data['updateTask']['conflict']['current']['version'], 3)
+
+
+class MyTasksTests(GraphQLTestCase):
+    MY_TASKS = '''
+        query($email: String!, $status: String, $first: Int, $after: String) {
+            myTasks(assigneeEmail: $email, status: $status, first: $first, after: $after) {
+                tasks { id project { name } }
+                endCursor
+                hasNextPage
+            }
+        }
+    '''
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        second = Project.objects.create(organization=cls.acme, name='Hardening')
+        foreign = Project.objects.create(organization=cls.other, name='Elsewhere')
+        for project in (cls.project, second, foreign):
+            for i in range(3):
+                Task.objects.create(project=project, title=f'Task {i}', assignee_email='dev@acme.test')
+
+    def test_pages_newest_first(self):
+        first = self.execute(self.MY_TASKS, self.acme, email='dev@acme.test', first=4).data['myTasks']
+        self.assertTrue(first['hasNextPage'])
+        second = self.execute(
+            self.MY_TASKS, self.acme, email='dev@acme.test', first=4, after=first['endCursor']
+        ).data['myTasks']
+        self.assertFalse(second['hasNextPage'])
+        ids = [int(task['id']) for task in first['tasks'] + second['tasks']]
+        self.assertEqual(len(ids), 6)
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    def test_projects_are_loaded_with_the_page(self):
+        with self.assertNumQueries(1):
+            result = self.execute(self.MY_TASKS, self.acme, email='dev@acme.test', first=50)
+        names = {task['project']['name'] for task in result.data['myTasks']['tasks']}
+        self.assertEqual(names, {'Launch', 'Hardening'})
+
+
+    def test_workload_counts(self):
+        Task.objects.filter(project__organization=self.acme, title='Task 0').update(status='DONE')
+        Task.objects.filter(project__organization=self.acme, title='Task 1').update(
+            status='IN_PROGRESS', due_date=timezone.now() - timedelta(days=1)
+        )
+        result = self.execute(
+            '{ assigneeWorkloads { assigneeEmail openCount inProgressCount overdueCount } }', self.acme
+        )
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data['assigneeWorkloads'], [{
+            'assigneeEmail': 'dev@acme.test', 'openCount': 4, 'inProgressCount': 2, 'overdueCount': 2
+        }])
+
+class IdentityMapTests(GraphQLTestCase):
+    def test_organization_query_reuses_request_organization(self):
+        request = RequestFactory().post('/graphql/')
+        request.organization = get_identity_map(request).setdefault(
+            Organization.objects.get(pk=self.acme.pk)
+        )
+        result = schema.execute('{ organization(slug: "acme") { name } }', context_value=request)
+        self.assertIsNone(result.errors)
+        self.assertIs(get_identity_map(request).get(Organization, self.acme.pk), request.organization)
@@ -0,0 +1,165 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core.throttling import (
+    CacheThrottleStore,
+    MemoryThrottleStore,
+    get_operation_type,
+    get_throttle_settings,
+)
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'throttle': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'throttle-tests'},
+}
+
+
+class OperationTypeTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_json_mutation(self):
+        request = self.factory.post(
+            '/graphql/',
+            {'query': 'mutation { updateTask(id: 1, status: "DONE") { task { id } } }'},
+            content_type='application/json'
+        )
+        self.assertEqual(get_operation_type(request), 'mutation')
+
+    def test_json_shorthand_query(self):
+        request = self.factory.post(
+            '/graphql/', {'query': '{ projects { id } }'}, content_type='application/json'
+        )
+        self.assertEqual(get_operation_type(request), 'query')
+
+    def test_operation_name_selects_operation(self):
+        query = 'query List { projects { id } } mutation Save { createProject(name: "x") { project { id } } }'
+        request = self.factory.post(
+            '/graphql/', {'query': query, 'operationName': 'Save'}, content_type='application/json'
+        )
+        self.assertEqual(get_operation_type(request), 'mutation')
+
+    def test_batched_request_with_mutation(self):
+        request = self.factory.post(
+            '/graphql/',
+            [{'query': '{ projects { id } }'}, {'query': 'mutation { createProject(name: "x") { project { id } } }'}],
+            content_type='application/json'
+        )
+        self.assertEqual(get_operation_type(request), 'mutation')
+
+    def test_graphql_content_type_mutation(self):
+        request = self.factory.post(
+            '/graphql/',
+            'mutation { updateTask(id: 1, status: "DONE") { task { id } } }',
+            content_type='application/graphql'
+        )
+        self.assertEqual(get_operation_type(request), 'mutation')
+
+    def test_query_alias_in_fragment_does_not_hide_mutation(self):
+        query = (
+            'fragment F on TaskType { query: title } '
+            'mutation { updateTask(id: 1, status: "DONE") { task { ...F } } }'
+        )
+        request = self.factory.post('/graphql/', {'query': query}, content_type='application/json')
+        self.assertEqual(get_operation_type(request), 'mutation')
+
+    def test_hash_inside_string_is_not_a_comment(self):
+        query = 'mutation { createProject(name: "#1") { project { id } } }'
+        request = self.factory.post('/graphql/', {'query': query}, content_type='application/json')
+        self.assertEqual(get_operation_type(request), 'mutation')
+
+    def test_unparseable_document_is_charged_as_query(self):
+        request = self.factory.post('/graphql/', {'query': 'mutation {'}, content_type='application/json')
+        self.assertEqual(get_operation_type(request), 'query')
+
+    def test_commented_out_mutation_is_ignored(self):
+        request = self.factory.get('/graphql/', {'query': '# mutation\n{ projects { id } }'})
+        self.assertEqual(get_operation_type(request), 'query')
+
+
+
+class ThrottleSettingsTests(SimpleTestCase):
+    def test_zero_rate_is_rejected(self):
+        with override_settings(GRAPHQL_THROTTLE={'RATE': 0}):
+            with self.assertRaises(ImproperlyConfigured):
+                get_throttle_settings()
+
+    def test_empty_burst_is_rejected(self):
+        with override_settings(GRAPHQL_THROTTLE={'BURST': 0}):
+            with self.assertRaises(ImproperlyConfigured):
+                get_throttle_settings()
+
+
+class MemoryThrottleStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.store = MemoryThrottleStore()
+        patcher = mock.patch('core.throttling.time.monotonic', return_value=100.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_wait(self):
+        for _ in range(2):
+            self.assertEqual(self.store.consume('acme:mutation', 5, 1.0, 10), 0.0)
+        # Bucket is empty: 5 tokens at 1 token/s
+        self.assertEqual(self.store.consume('acme:mutation', 5, 1.0, 10), 5.0)
+
+    def test_refill_is_capped_at_burst(self):
+        self.store.consume('acme:query', 10, 1.0, 10)
+        self.clock.return_value = 1000.0
+        self.assertEqual(self.store.consume('acme:query', 10, 1.0, 10), 0.0)
+        self.assertGreater(self.store.consume('acme:query', 1, 1.0, 10), 0.0)
+
+    def test_partial_refill(self):
+        self.store.consume('acme:query', 10, 2.0, 10)
+        self.clock.return_value = 101.0
+        self.assertEqual(self.store.consume('acme:query', 2, 2.0, 10), 0.0)
+        self.assertEqual(self.store.consume('acme:query', 1, 2.0, 10), 0.5)
+
+    def test_buckets_are_per_key(self):
+        self.store.consume('acme:mutation', 10, 1.0, 10)
+        self.assertEqual(self.store.consume('other:mutation', 10, 1.0, 10), 0.0)
+
+    def test_concurrency_cap(self):
+        self.assertTrue(self.store.acquire('acme', 2))
+        self.assertTrue(self.store.acquire('acme', 2))
+        self.assertFalse(self.store.acquire('acme', 2))
+        self.store.release('acme')
+        self.assertTrue(self.store.acquire('acme', 2))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheThrottleStoreTests(SimpleTestCase):
+    def setUp(self):
+        caches['throttle'].clear()
+        self.store = CacheThrottleStore('throttle', 'test', 60)
+
+    def test_bucket_shared_through_cache(self):
+        other = CacheThrottleStore('throttle', 'test', 60)
+        self.assertEqual(self.store.consume('acme:mutation', 5, 1.0, 6), 0.0)
+        self.assertGreater(other.consume('acme:mutation', 5, 1.0, 6), 0.0)
+
+    def test_concurrency_cap(self):
+        self.assertTrue(self.store.acquire('acme', 2))
+        self.assertTrue(self.store.acquire('acme', 2))
+        self.assertFalse(self.store.acquire('acme', 2))
+        self.store.release('acme')
+        self.assertTrue(self.store.acquire('acme', 2))
+
+    def test_rejected_acquire_does_not_leak_a_slot(self):
+        self.store.acquire('acme', 1)
+        self.store.acquire('acme', 1)
+        self.store.release('acme')
+        self.assertTrue(self.store.acquire('acme', 1))
+
+    def test_release_after_expiry_clamps_at_zero(self):
+        self.store.acquire('acme', 2)
+        # Simulate the counter expiring and being recreated by other traffic
+        caches['throttle'].set('test:inflight:acme', 0)
+        self.store.release('acme')
+        self.assertEqual(caches['throttle'].get('test:inflight:acme'), 0)
+        self.assertTrue(self.store.acquire('acme', 2))
+        self.assertTrue(self.store.acquire('acme', 2))
+        self.assertFalse(self.store.acquire('acme', 2))
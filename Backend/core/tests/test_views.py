@@ -0,0 +1,42 @@
+import gzip
+import json
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from core.views import CompressedGraphQLView, available_encodings, compress, parse_accept_encoding
+
+
+class AcceptEncodingTests(SimpleTestCase):
+    def test_zero_quality_is_refused(self):
+        self.assertEqual(parse_accept_encoding('gzip, br;q=0, zstd;q=0.5'), {'gzip', 'zstd'})
+
+
+class CompressResponseTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.view = CompressedGraphQLView()
+        self.body = json.dumps({'data': {'tasks': [{'id': str(i)} for i in range(500)]}}).encode()
+
+    def test_large_response_is_compressed_with_content_length(self):
+        request = self.factory.post('/graphql/', HTTP_ACCEPT_ENCODING='gzip')
+        response = self.view.compress_response(
+            request, HttpResponse(self.body, content_type='application/json')
+        )
+        self.assertFalse(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), self.body)
+
+    def test_small_response_is_left_alone(self):
+        request = self.factory.post('/graphql/', HTTP_ACCEPT_ENCODING='gzip')
+        response = self.view.compress_response(
+            request, HttpResponse(b'{"data":{}}', content_type='application/json')
+        )
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_every_available_encoding_produces_output(self):
+        for coding in available_encodings():
+            with self.subTest(coding=coding):
+                self.assertLess(len(compress(self.body, coding)), len(self.body))
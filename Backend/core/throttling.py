@@ -0,0 +1,244 @@
+"""
+Per-organization rate limiting and concurrency quotas for the GraphQL endpoint.
+
+State lives in process memory by default. Set ``CACHE_ALIAS`` in the
+``GRAPHQL_THROTTLE`` setting to share buckets and in-flight counters between
+worker processes through a Django cache backend.
+"""
+import json
+import logging
+import math
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from graphql import GraphQLError, OperationType, parse
+from graphql.utilities import get_operation_ast
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': True,
+    # Tokens refilled per second and bucket capacity, per organization and operation type
+    'RATE': 10.0,
+    'BURST': 60,
+    # Tokens consumed by a single request of each operation type
+    'QUERY_COST': 1,
+    'MUTATION_COST': 5,
+    # Maximum in-flight GraphQL requests per organization (0 disables the cap)
+    'MAX_CONCURRENT': 10,
+    # Django cache alias used to share state between processes (None keeps it in memory)
+    'CACHE_ALIAS': None,
+    # Lifetime of shared in-flight counters; must exceed the longest request
+    'INFLIGHT_TIMEOUT': 300,
+    'CACHE_PREFIX': 'graphql-throttle',
+}
+
+ANONYMOUS_TENANT = 'anonymous'
+
+
+def get_throttle_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'GRAPHQL_THROTTLE', {}))
+    if config['RATE'] <= 0:
+        raise ImproperlyConfigured("GRAPHQL_THROTTLE['RATE'] must be greater than 0.")
+    if config['BURST'] < 1:
+        raise ImproperlyConfigured("GRAPHQL_THROTTLE['BURST'] must be at least 1.")
+    return config
+
+
+def get_operation_type(request):
+    """
+    Return 'mutation' or 'query' for a GraphQL request.
+    """
+    query = None
+    operation_name = None
+
+    if request.method == 'POST':
+        if request.content_type == 'application/graphql':
+            # The raw body is the query document, as in GraphQLView.parse_body
+            try:
+                return _detect_operation(request.body.decode('utf-8'))
+            except UnicodeDecodeError:
+                return 'query'
+        elif request.content_type == 'application/json':
+            try:
+                payload = json.loads(request.body or b'{}')
+            except (ValueError, UnicodeDecodeError):
+                payload = {}
+            # Batched requests are charged as mutations if any entry is one
+            if isinstance(payload, list):
+                for entry in payload:
+                    if isinstance(entry, dict) and _detect_operation(
+                        entry.get('query'), entry.get('operationName')
+                    ) == 'mutation':
+                        return 'mutation'
+                return 'query'
+            if isinstance(payload, dict):
+                query = payload.get('query')
+                operation_name = payload.get('operationName')
+        else:
+            query = request.POST.get('query')
+            operation_name = request.POST.get('operationName')
+
+    if query is None:
+        query = request.GET.get('query')
+        operation_name = operation_name or request.GET.get('operationName')
+
+    return _detect_operation(query, operation_name)
+
+
+def _detect_operation(query, operation_name=None):
+    if not isinstance(query, str):
+        return 'query'
+
+    # Invalid documents are rejected by the view; charge them as queries
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return 'query'
+
+    operation = get_operation_ast(document, operation_name)
+    if operation is not None and operation.operation == OperationType.MUTATION:
+        return 'mutation'
+    return 'query'
+
+
+class MemoryThrottleStore:
+    """
+    Token buckets and in-flight counters kept in the current process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._in_flight = Counter()
+
+    def consume(self, key, cost, rate, burst):
+        """
+        Take ``cost`` tokens from the bucket; return seconds to wait if there are not enough.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(burst), now))
+            tokens = min(float(burst), tokens + (now - updated) * rate)
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (cost - tokens) / rate
+
+    def acquire(self, key, limit):
+        with self._lock:
+            if self._in_flight[key] >= limit:
+                return False
+            self._in_flight[key] += 1
+            return True
+
+    def release(self, key):
+        with self._lock:
+            self._in_flight[key] -= 1
+            if self._in_flight[key] <= 0:
+                del self._in_flight[key]
+
+
+class CacheThrottleStore:
+    """
+    Token buckets and in-flight counters kept in a Django cache backend.
+
+    Bucket updates are read-modify-write and therefore best effort under
+    contention; in-flight counters rely on the backend's atomic ``incr``.
+    In-flight counters are refreshed on every acquire and expire after
+    ``inflight_timeout`` seconds of inactivity. A counter that expires while
+    requests are still running undercounts until they finish; releases are
+    clamped at zero so the drift does not outlive them.
+    """
+
+    def __init__(self, alias, prefix, inflight_timeout):
+        self.cache = caches[alias]
+        self.prefix = prefix
+        self.inflight_timeout = inflight_timeout
+
+    def _key(self, kind, key):
+        return f'{self.prefix}:{kind}:{key}'
+
+    def consume(self, key, cost, rate, burst):
+        cache_key = self._key('bucket', key)
+        now = time.time()
+        tokens, updated = self.cache.get(cache_key) or (float(burst), now)
+        tokens = min(float(burst), tokens + max(0.0, now - updated) * rate)
+        # Expire idle buckets once they would have refilled completely
+        timeout = math.ceil(burst / rate) + 1
+        if tokens >= cost:
+            self.cache.set(cache_key, (tokens - cost, now), timeout)
+            return 0.0
+        self.cache.set(cache_key, (tokens, now), timeout)
+        return (cost - tokens) / rate
+
+    def acquire(self, key, limit):
+        cache_key = self._key('inflight', key)
+        self.cache.add(cache_key, 0, self.inflight_timeout)
+        try:
+            current = self.cache.incr(cache_key)
+        except ValueError:
+            # The key expired between add() and incr()
+            self.cache.set(cache_key, 1, self.inflight_timeout)
+            current = 1
+        self.cache.touch(cache_key, self.inflight_timeout)
+        if current > limit:
+            self.release(key)
+            return False
+        return True
+
+    def release(self, key):
+        cache_key = self._key('inflight', key)
+        try:
+            current = self.cache.decr(cache_key)
+        except ValueError:
+            return
+        if current < 0:
+            self.cache.set(cache_key, 0, self.inflight_timeout)
+
+
+class ThrottleMetrics:
+    """
+    In-process counters of throttled requests, keyed by organization and reason.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def record(self, tenant, operation, reason):
+        with self._lock:
+            self._counts[(tenant, operation, reason)] += 1
+        logger.warning(
+            'Throttled GraphQL %s for organization %s (%s)', operation, tenant, reason
+        )
+
+    def snapshot(self):
+        with self._lock:
+            return [
+                {'organization': tenant, 'operation': operation, 'reason': reason, 'count': count}
+                for (tenant, operation, reason), count in sorted(self._counts.items())
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+throttle_metrics = ThrottleMetrics()
+
+_memory_store = MemoryThrottleStore()
+
+
+def get_throttle_store(config):
+    if config['CACHE_ALIAS']:
+        return CacheThrottleStore(
+            config['CACHE_ALIAS'], config['CACHE_PREFIX'], config['INFLIGHT_TIMEOUT']
+        )
+    return _memory_store
@@ -0,0 +1,144 @@
+"""
+GraphQL view with compact JSON serialization and negotiated response compression.
+
+orjson, brotli and zstandard are optional; whichever are installed get used.
+"""
+import gzip
+import json
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from graphene_django.views import GraphQLView
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULTS = {
+    # Responses smaller than this are sent uncompressed
+    'COMPRESS_MIN_SIZE': 1024,
+    # Preferred encodings, best first; unavailable ones are skipped
+    'ENCODINGS': ['zstd', 'br', 'gzip'],
+}
+
+
+def get_response_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'GRAPHQL_RESPONSE', {}))
+    return config
+
+
+def encode_json(data):
+    """
+    Serialize to compact UTF-8 JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _gzip_compress(body):
+    return gzip.compress(body, compresslevel=6)
+
+
+def _brotli_compress(body):
+    return brotli.compress(body, quality=5)
+
+
+def _zstd_compress(body):
+    return zstandard.ZstdCompressor(level=3).compress(body)
+
+
+def available_encodings():
+    encodings = {'gzip': _gzip_compress}
+    if brotli is not None:
+        encodings['br'] = _brotli_compress
+    if zstandard is not None:
+        encodings['zstd'] = _zstd_compress
+    return encodings
+
+
+def parse_accept_encoding(header):
+    """
+    Return the set of content codings the client accepts (q > 0).
+    """
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def negotiate_encoding(request, preferred):
+    accepted = parse_accept_encoding(request.headers.get('Accept-Encoding', ''))
+    encodings = available_encodings()
+    for coding in preferred:
+        if coding in encodings and (coding in accepted or '*' in accepted):
+            return coding
+    return None
+
+
+def compress(body, coding):
+    return available_encodings()[coding](body)
+
+
+class CompressedGraphQLView(GraphQLView):
+    """
+    GraphQLView that serializes with orjson when available and compresses
+    large JSON responses according to the client's Accept-Encoding.
+    """
+
+    def json_encode(self, request, d, pretty=False):
+        # Batched responses are joined as text by the base view
+        if self.pretty or pretty or request.GET.get('pretty') or self.batch:
+            return super().json_encode(request, d, pretty=pretty)
+        return encode_json(d)
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        return self.compress_response(request, response)
+
+    def compress_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if not response.get('Content-Type', '').startswith('application/json'):
+            return response
+
+        config = get_response_settings()
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        body = response.content
+        if len(body) < config['COMPRESS_MIN_SIZE']:
+            return response
+
+        coding = negotiate_encoding(request, config['ENCODINGS'])
+        if coding is None:
+            return response
+
+        response.content = compress(body, coding)
+        response['Content-Encoding'] = coding
+        response['Content-Length'] = str(len(response.content))
+        return response
@@ -39,6 +39,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'core.middleware.OrganizationMiddleware',
+    'core.middleware.GraphQLThrottleMiddleware',
 ]
 
 ROOT_URLCONF = 'screening_task.urls'
@@ -104,6 +105,30 @@ GRAPHENE = {
     'SCHEMA': 'core.schema.schema'
 }
 
+# GraphQL rate limiting per organization (see core/throttling.py for all options)
+GRAPHQL_THROTTLE = {
+    'ENABLED': config('GRAPHQL_THROTTLE_ENABLED', default=True, cast=bool),
+    'RATE': config('GRAPHQL_THROTTLE_RATE', default=10.0, cast=float),
+    'BURST': config('GRAPHQL_THROTTLE_BURST', default=60, cast=int),
+    'QUERY_COST': 1,
+    'MUTATION_COST': 5,
+    'MAX_CONCURRENT': config('GRAPHQL_THROTTLE_MAX_CONCURRENT', default=10, cast=int),
+    'CACHE_ALIAS': config('GRAPHQL_THROTTLE_CACHE_ALIAS', default=None),
+}
+
+# Cross-request cache of Organization and Project rows (see core/loaders.py for all options)
+OBJECT_CACHE = {
+    'ENABLED': config('OBJECT_CACHE_ENABLED', default=False, cast=bool),
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+# GraphQL response serialization and compression (see core/views.py for all options)
+GRAPHQL_RESPONSE = {
+    'COMPRESS_MIN_SIZE': 1024,
+    'ENCODINGS': ['zstd', 'br', 'gzip'],
+}
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
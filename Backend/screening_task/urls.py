@@ -4,8 +4,10 @@ URL configuration for screening_task project.
 from django.contrib import admin
 from django.urls import path
 from django.http import JsonResponse
-from graphene_django.views import GraphQLView
 from django.views.decorators.csrf import csrf_exempt
+from django.contrib.admin.views.decorators import staff_member_required
+from core.throttling import throttle_metrics
+from core.views import CompressedGraphQLView
 
 def api_info(request):
     return JsonResponse({
@@ -15,8 +17,13 @@ def api_info(request):
         'status': 'running'
     })
 
+@staff_member_required
+def throttle_stats(request):
+    return JsonResponse({'throttled': throttle_metrics.snapshot()})
+
 urlpatterns = [
     path('', api_info, name='api_info'),
     path('admin/', admin.site.urls),
-    path('graphql/', csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path('metrics/throttle/', throttle_stats, name='throttle_stats'),
+    path('graphql/', csrf_exempt(CompressedGraphQLView.as_view(graphiql=True))),
 ]
\ No newline at end of file